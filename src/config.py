@@ -1,5 +1,7 @@
 """Manages environment variables, API keys, model parameters, and system-wide settings for the weather agent."""
 
+import functools
+import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -53,6 +55,17 @@ class Settings:
 
         # Logging configuration
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        self.numeric_log_level = getattr(logging, self.log_level.upper(), logging.INFO)
+
+        # Derived values, ready to pass to downstream clients
+        self.model_kwargs = {
+            "model": self.model_config.model_name,
+            "base_url": self.model_config.base_url,
+            "api_key": self.model_config.api_key,
+            "temperature": self.model_config.temperature,
+            "max_tokens": self.model_config.max_tokens,
+        }
+        self.weather_params = {"key": self.weather_config.api_key}
 
     def validate_configuration(self) -> bool:
         """
@@ -61,8 +74,12 @@ class Settings:
         Returns:
             True if configuration is valid, False otherwise
         """
-        required_keys = ["API_KEY", "BASE_URL"]
-        missing_keys = [key for key in required_keys if not os.getenv(key)]
+        required_values = {
+            "MODEL_API_KEY": self.model_config.api_key,
+            "MODEL_BASE_URL": self.model_config.base_url,
+            "WEATHER_API_KEY": self.weather_config.api_key,
+        }
+        missing_keys = [key for key, value in required_values.items() if not value]
 
         if missing_keys:
             print(f"Missing required environment variables: {missing_keys}")
@@ -71,5 +88,16 @@ class Settings:
         return True
 
 
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the shared settings instance, loading it on first call.
+
+    Returns:
+        Settings parsed once from the environment
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
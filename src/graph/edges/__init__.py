@@ -1,5 +1,3 @@
 """Graph edges - conditional routing logic."""
 
-from src.graph.edges.agent_to_tools import should_continue
-
-__all__ = ["should_continue"]
+__all__ = []
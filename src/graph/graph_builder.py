@@ -1,28 +1,37 @@
 """Main graph builder."""
 
-from langgraph.graph import StateGraph, START, END
+from langgraph.cache.memory import InMemoryCache
+from langgraph.graph import StateGraph, START
+from langgraph.types import CachePolicy
 from langchain_openai import ChatOpenAI
 from src.graph.state import AgentState
 from src.graph.nodes.agent import create_agent_node
 from src.graph.nodes.tools import create_tool_node
-from src.graph.edges import should_continue
 from src.config import settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled graphs keyed by the identity of the tool objects they were built with
+_compiled_graphs: dict = {}
+
+# Reuse agent responses for identical conversations for a few minutes
+AGENT_CACHE_TTL_SECONDS = 300
+
+
+def _agent_cache_key(state: AgentState) -> str:
+    """Build the agent node cache key from the conversation so far."""
+    return repr([
+        (message.type, message.content, getattr(message, "tool_calls", None))
+        for message in state["messages"]
+    ])
+
 
 def build_graph(tools):
     """Build the agent graph."""
     
     # Initialize model from configuration
-    model = ChatOpenAI(
-        model=settings.model_config.model_name,
-        base_url=settings.model_config.base_url,
-        api_key=settings.model_config.api_key,
-        temperature=settings.model_config.temperature,
-        max_tokens=settings.model_config.max_tokens,
-    )
+    model = ChatOpenAI(**settings.model_kwargs)
     
     model_with_tools = model.bind_tools(tools)
     
@@ -30,12 +39,34 @@ def build_graph(tools):
     graph = StateGraph(AgentState)
     
     # Add nodes
-    graph.add_node("agent", create_agent_node(model_with_tools))
+    graph.add_node(
+        "agent",
+        create_agent_node(model_with_tools),
+        cache_policy=CachePolicy(key_func=_agent_cache_key, ttl=AGENT_CACHE_TTL_SECONDS),
+    )
     graph.add_node("tools", create_tool_node(tools))
     
-    # Add edges
+    # Add edges (the agent node routes itself to "tools" or END via Command)
     graph.add_edge(START, "agent")
-    graph.add_conditional_edges("agent", should_continue)
     graph.add_edge("tools", "agent")
     
-    return graph.compile()
\ No newline at end of file
+    return graph.compile(cache=InMemoryCache())
+
+
+def get_compiled_graph(tools):
+    """Return the compiled graph for these tools, building it on first use."""
+    # Tools are bound to the MCP session that loaded them, so names alone don't identify them.
+    # The cached graph keeps its tools alive, so their ids can't be reused while it exists.
+    tools_key = tuple(id(tool) for tool in tools)
+    
+    compiled_graph = _compiled_graphs.get(tools_key)
+    if compiled_graph is None:
+        logger.info("Compiling agent graph")
+        compiled_graph = _compiled_graphs[tools_key] = build_graph(tools)
+    
+    return compiled_graph
+
+
+def reset_compiled_graphs():
+    """Drop all cached compiled graphs, e.g. once the tools they use are closed."""
+    _compiled_graphs.clear()
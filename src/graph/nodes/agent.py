@@ -1,7 +1,13 @@
 """Agent node that calls the model with tools."""
 
+import logging
+from typing import Literal
+
+from langchain_core.messages import message_chunk_to_message
+from langchain_core.messages.ai import add_ai_message_chunks
+from langgraph.graph import END
+from langgraph.types import Command
 from src.graph.state import AgentState
-from langchain_core.messages import BaseMessage
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -10,19 +16,33 @@ logger = get_logger(__name__)
 def create_agent_node(model_with_tools):
     """Create agent node with bound tools."""
     
-    def agent_node(state: AgentState) -> AgentState:
-        """Call the model with tools."""
+    async def agent_node(state: AgentState) -> Command[Literal["tools", "__end__"]]:
+        """Call the model with tools and route to the tool node or end."""
         logger.info("--- Agent Node ---")
-        logger.info(f"Total messages in state: {len(state['messages'])}")
+        logger.info("Total messages in state: %d", len(state["messages"]))
+        
+        # Stream the generation so the event loop stays free and tokens surface early
+        chunks = [chunk async for chunk in model_with_tools.astream(state["messages"])]
+        if not chunks:
+            raise RuntimeError("Model stream ended without producing a response")
         
-        response = model_with_tools.invoke(state["messages"])
+        # Merge all chunks in one pass rather than re-merging on every token
+        response = message_chunk_to_message(add_ai_message_chunks(chunks[0], *chunks[1:]))
         
-        logger.info(f"Model response type: {response.__class__.__name__}")
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            logger.info(f"Tool calls requested: {[tc.get('name') for tc in response.tool_calls]}")
+        logger.info("Model response type: %s", response.__class__.__name__)
+        # Store None rather than an empty list when the model requested no tools
+        tool_calls = response.tool_calls or None
+        if tool_calls:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Tool calls requested: %s", [tc.get("name") for tc in tool_calls])
+            goto = "tools"
         else:
             logger.info("No tool calls - final answer provided")
+            goto = END
         
-        return {"messages": state["messages"] + [response]}
+        return Command(
+            update={"messages": [response], "pending_tool_calls": tool_calls},
+            goto=goto,
+        )
     
-    return agent_node
\ No newline at end of file
+    return agent_node
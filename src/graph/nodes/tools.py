@@ -1,5 +1,7 @@
 """Tool execution node."""
 
+import asyncio
+import orjson
 from src.graph.state import AgentState
 from langchain_core.messages import ToolMessage
 from src.utils.logger import get_logger
@@ -7,50 +9,80 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _tool_message(content: str, tool_call_id: str, name: str) -> ToolMessage:
+    """Build a ToolMessage without running pydantic validation."""
+    return ToolMessage.model_construct(
+        content=content,
+        tool_call_id=tool_call_id,
+        name=name,
+        type="tool",
+    )
+
+
+def _serialize_result(result) -> str:
+    """Serialize a tool result to a string, using JSON for structured results."""
+    if isinstance(result, str):
+        return result
+    try:
+        return orjson.dumps(result).decode("utf-8")
+    except TypeError:
+        return str(result)
+
+
 def create_tool_node(tools):
     """Create tool execution node."""
     
+    tools_by_name = {tool.name: tool for tool in tools}
+    
+    async def run_tool_call(tool_call) -> ToolMessage:
+        """Execute a single tool call and wrap its result in a ToolMessage."""
+        tool_name = tool_call.get('name')
+        tool_args = tool_call.get('args', {})
+        tool_id = tool_call.get('id')
+        
+        logger.info("Calling tool: %s", tool_name)
+        
+        tool = tools_by_name.get(tool_name)
+        if tool is None:
+            logger.error("Tool %s not found", tool_name)
+            return _tool_message(
+                content=f"Error: tool '{tool_name}' not found",
+                tool_call_id=tool_id,
+                name=tool_name,
+            )
+        
+        try:
+            result = await tool.ainvoke(tool_args)
+            logger.info("Tool %s completed successfully", tool_name)
+            
+            return _tool_message(
+                content=_serialize_result(result),
+                tool_call_id=tool_id,
+                name=tool_name,
+            )
+        except Exception as e:
+            # Convert failures into messages so one failing tool doesn't cancel its siblings
+            logger.error("Tool %s failed: %s", tool_name, e)
+            return _tool_message(
+                content=f"Error: {str(e)}",
+                tool_call_id=tool_id,
+                name=tool_name,
+            )
+    
     async def process_tool_calls(state: AgentState) -> AgentState:
-        """Process tool calls asynchronously and append results to messages."""
+        """Process tool calls concurrently and return their results as new messages."""
         logger.info("--- Tool Node ---")
         
-        last_message = state["messages"][-1]
-        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-            logger.info(f"Executing {len(last_message.tool_calls)} tool call(s)")
+        tool_calls = state.get("pending_tool_calls")
+        if tool_calls:
+            logger.info("Executing %d tool call(s)", len(tool_calls))
             
-            tool_messages = []
-            for tool_call in last_message.tool_calls:
-                tool_name = tool_call.get('name')
-                tool_args = tool_call.get('args', {})
-                tool_id = tool_call.get('id')
-                
-                logger.info(f"Calling tool: {tool_name}")
-                
-                # Find and execute the tool
-                for tool in tools:
-                    if tool.name == tool_name:
-                        try:
-                            result = await tool.ainvoke(tool_args)
-                            logger.info(f"Tool {tool_name} completed successfully")
-                            
-                            tool_msg = ToolMessage(
-                                content=str(result),
-                                tool_call_id=tool_id,
-                                name=tool_name
-                            )
-                            tool_messages.append(tool_msg)
-                        except Exception as e:
-                            logger.error(f"Tool {tool_name} failed: {e}")
-                            tool_msg = ToolMessage(
-                                content=f"Error: {str(e)}",
-                                tool_call_id=tool_id,
-                                name=tool_name
-                            )
-                            tool_messages.append(tool_msg)
-                        break
+            tool_messages = await asyncio.gather(
+                *(run_tool_call(tool_call) for tool_call in tool_calls)
+            )
             
-            return {"messages": state["messages"] + tool_messages}
+            return {"messages": tool_messages, "pending_tool_calls": None}
         
-        return state
+        return {"messages": [], "pending_tool_calls": None}
     
-    return process_tool_calls
\ No newline at end of file
+    return process_tool_calls
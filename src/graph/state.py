@@ -1,7 +1,12 @@
+from typing import Annotated, Optional
+
 from typing_extensions import TypedDict
 from langchain_core.messages import BaseMessage
+from langgraph.graph.message import add_messages
 
 
 class AgentState(TypedDict):
     """State for the weather agent workflow."""
-    messages: list[BaseMessage]
\ No newline at end of file
+    messages: Annotated[list[BaseMessage], add_messages]
+    # Tool calls from the latest model response, cleared once the tool node runs them
+    pending_tool_calls: Optional[list[dict]]
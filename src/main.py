@@ -1,41 +1,68 @@
 """Main entry point for the weather agent."""
 
 import asyncio
+import sys
 from langchain_core.messages import HumanMessage
-from src.tools.weather_mcp import initialize_mcp_client
-from src.graph.graph_builder import build_graph
+from src.tools.weather_mcp import close_mcp_client, initialize_mcp_client
+from src.graph.graph_builder import get_compiled_graph, reset_compiled_graphs
+from src.config import settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 async def main():
-    logger.info("Initializing MCP client and loading tools...")
-    tools = await initialize_mcp_client()
-    
-    logger.info("Building agent graph...")
-    compiled_graph = build_graph(tools)
-    
-    logger.info("Starting agent execution")
-    
-    initial_state = {
-        "messages": [HumanMessage(content="Compare air quality between Tehran and New York")]
-    }
+    # Run fast-completing tasks inline up to their first await (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     
-    logger.info(f"User query: {initial_state['messages'][0].content}")
+    if not settings.validate_configuration():
+        raise RuntimeError("Invalid configuration, check your .env file")
     
-    result = await compiled_graph.ainvoke(initial_state)
-    
-    logger.info("Agent execution complete")
+    logger.info("Initializing MCP client and loading tools...")
+    tools = await initialize_mcp_client()
     
-    final_message = result["messages"][-1]
-    logger.info(f"Total messages: {len(result['messages'])}")
+    try:
+        logger.info("Building agent graph...")
+        compiled_graph = get_compiled_graph(tools)
+        
+        logger.info("Starting agent execution")
+        
+        initial_state = {
+            "messages": [HumanMessage(content="Compare air quality between Tehran and New York")]
+        }
+        
+        logger.info("User query: %s", initial_state["messages"][0].content)
+        
+        result = await compiled_graph.ainvoke(initial_state)
+        
+        logger.info("Agent execution complete")
+        
+        final_message = result["messages"][-1]
+        logger.info("Total messages: %d", len(result["messages"]))
+        
+        if hasattr(final_message, "content"):
+            print("\n" + final_message.content)
+        else:
+            print("\n" + str(final_message))
+    finally:
+        # The cached graph's tools are bound to this session, so drop it along with the session
+        reset_compiled_graphs()
+        await close_mcp_client()
+
+
+def run():
+    """Run the agent on uvloop when available, falling back to the default event loop."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("uvloop not installed, using default asyncio event loop")
+        else:
+            return uvloop.run(main())
     
-    if hasattr(final_message, "content"):
-        print("\n" + final_message.content)
-    else:
-        print("\n" + str(final_message))
+    return asyncio.run(main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -1,5 +1,5 @@
 """Weather MCP server and client."""
 
-from src.tools.weather_mcp.client import initialize_mcp_client
+from src.tools.weather_mcp.client import close_mcp_client, initialize_mcp_client
 
-__all__ = ["initialize_mcp_client"]
\ No newline at end of file
+__all__ = ["close_mcp_client", "initialize_mcp_client"]
\ No newline at end of file
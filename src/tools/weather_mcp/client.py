@@ -1,13 +1,24 @@
 """MCP client initialization and tool loading."""
 
+from contextlib import AsyncExitStack
+
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Persistent MCP session and the tools loaded from it, shared across agent runs
+_exit_stack: AsyncExitStack | None = None
+_tools = None
+
 
 async def initialize_mcp_client():
-    """Initialize MCP client and load weather tools."""
+    """Initialize MCP client and load weather tools, reusing an open session."""
+    global _exit_stack, _tools
+    if _tools is not None:
+        return _tools
+    
     mcp_client = MultiServerMCPClient(
         {
             "weather": {
@@ -18,7 +29,24 @@ async def initialize_mcp_client():
         }
     )
     
-    tools = await mcp_client.get_tools()
-    logger.info(f"Loaded {len(tools)} tools from MCP server")
+    # Keep one server process and session alive so tool calls don't respawn it
+    exit_stack = AsyncExitStack()
+    try:
+        session = await exit_stack.enter_async_context(mcp_client.session("weather"))
+        tools = await load_mcp_tools(session)
+    except BaseException:
+        await exit_stack.aclose()
+        raise
     
-    return tools
\ No newline at end of file
+    _exit_stack, _tools = exit_stack, tools
+    logger.info("Loaded %d tools from MCP server", len(tools))
+    
+    return tools
+
+
+async def close_mcp_client():
+    """Close the persistent MCP session, if one is open."""
+    global _exit_stack, _tools
+    if _exit_stack is not None:
+        await _exit_stack.aclose()
+    _exit_stack, _tools = None, None
@@ -1,29 +1,68 @@
+import asyncio
 import httpx
+from cachetools import TTLCache
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from mcp.server.fastmcp import FastMCP
 from src.config import settings
 
-mcp = FastMCP("Weather")
-
 WEATHER_API_KEY = settings.weather_config.api_key
 WEATHER_API_BASE_URL = settings.weather_config.base_url
 
+# Endpoint paths (relative to the client's base URL) and fixed query params
+CURRENT_WEATHER_PATH = "/current.json"
+ASTRONOMY_PATH = "/astronomy.json"
+_CURRENT_WEATHER_PARAMS = {**settings.weather_params, "aqi": "yes"}
+_ASTRONOMY_PARAMS = settings.weather_params
+
+# Shared HTTP client so repeated tool calls reuse keep-alive connections
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=WEATHER_API_BASE_URL,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+        )
+    return _client
+
+
+# Short-lived cache of current.json responses; several tools project the same payload
+_weather_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+# Fetches currently running, so concurrent calls for one location share a request
+_weather_in_flight: dict[str, asyncio.Task] = {}
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared HTTP client when the MCP server shuts down."""
+    global _client
+    try:
+        yield
+    finally:
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+
+
+mcp = FastMCP("Weather", lifespan=lifespan)
 
-def _fetch_current_weather(location: str) -> dict:
-    """Helper function to fetch current weather data from API."""
+
+async def _request_current_weather(location: str) -> dict:
+    """Helper function to request current weather data from API."""
     if not WEATHER_API_KEY:
         return {"error": "API key not found"}
     
-    weather_api_url = f"{WEATHER_API_BASE_URL}/current.json"
-    params = {
-        "key": WEATHER_API_KEY,
-        "q": location,
-        "aqi": "yes",
-    }
+    params = {**_CURRENT_WEATHER_PARAMS, "q": location}
     
     try:
-        response = httpx.get(weather_api_url, params=params, timeout=10.0)
+        response = await _get_client().get(CURRENT_WEATHER_PATH, params=params)
         response.raise_for_status()
         data = response.json()
         return data
@@ -33,7 +72,33 @@ def _fetch_current_weather(location: str) -> dict:
         return {"error": f"Failed to fetch weather: {str(e)}"}
 
 
-def _fetch_astronomy_data(location: str, date: str = None) -> dict:
+async def _request_and_cache_current_weather(location: str, cache_key: str) -> dict:
+    """Helper function to request current weather data and cache successful responses."""
+    data = await _request_current_weather(location)
+    if data and "error" not in data:
+        _weather_cache[cache_key] = data
+    return data
+
+
+async def _fetch_current_weather(location: str) -> dict:
+    """Helper function to fetch current weather data, served from cache when fresh."""
+    cache_key = location.strip().lower()
+    data = _weather_cache.get(cache_key)
+    if data is not None:
+        return data
+    
+    # Join an in-flight fetch for the same location instead of hitting the API again
+    task = _weather_in_flight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_request_and_cache_current_weather(location, cache_key))
+        _weather_in_flight[cache_key] = task
+        task.add_done_callback(lambda _: _weather_in_flight.pop(cache_key, None))
+    
+    # Shield so one cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_astronomy_data(location: str, date: str = None) -> dict:
     """Helper function to fetch astronomy data from API."""
     if not WEATHER_API_KEY:
         return {"error": "API key not found"}
@@ -42,15 +107,10 @@ def _fetch_astronomy_data(location: str, date: str = None) -> dict:
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
     
-    astronomy_api_url = f"{WEATHER_API_BASE_URL}/astronomy.json"
-    params = {
-        "key": WEATHER_API_KEY,
-        "q": location,
-        "dt": date,
-    }
+    params = {**_ASTRONOMY_PARAMS, "q": location, "dt": date}
     
     try:
-        response = httpx.get(astronomy_api_url, params=params, timeout=10.0)
+        response = await _get_client().get(ASTRONOMY_PATH, params=params)
         response.raise_for_status()
         data = response.json()
         return data
@@ -61,7 +121,7 @@ def _fetch_astronomy_data(location: str, date: str = None) -> dict:
 
 
 @mcp.tool()
-def get_current_weather(location: str) -> dict:
+async def get_current_weather(location: str) -> dict:
     """
     Get current weather and wind information for a given location.
     
@@ -78,7 +138,7 @@ def get_current_weather(location: str) -> dict:
         - Whether it's currently day or night (1 for day, 0 for night)
         - Location details: name, region, country, and local time
     """
-    data = _fetch_current_weather(location)
+    data = await _fetch_current_weather(location)
     if not data or "error" in data:
         return data or {"error": "Failed to fetch weather data"}
     
@@ -108,7 +168,7 @@ def get_current_weather(location: str) -> dict:
 
 
 @mcp.tool()
-def get_current_atmospheric_conditions(location: str) -> dict:
+async def get_current_atmospheric_conditions(location: str) -> dict:
     """
     Get current atmospheric conditions for a given location.
     
@@ -126,7 +186,7 @@ def get_current_atmospheric_conditions(location: str) -> dict:
         - Dew point in Celsius
         - Location details: name, region, country, and local time
     """
-    data = _fetch_current_weather(location)
+    data = await _fetch_current_weather(location)
     if not data or "error" in data:
         return data or {"error": "Failed to fetch weather data"}
     
@@ -153,7 +213,7 @@ def get_current_atmospheric_conditions(location: str) -> dict:
 
 
 @mcp.tool()
-def get_current_astronomical_data(location: str) -> dict:
+async def get_current_astronomical_data(location: str) -> dict:
     """
     Get current astronomical data for a given location.
     
@@ -170,7 +230,7 @@ def get_current_astronomical_data(location: str) -> dict:
         - Whether the moon is currently up (1 for yes, 0 for no)
         - Location details: name, region, country, and local time
     """
-    data = _fetch_astronomy_data(location)
+    data = await _fetch_astronomy_data(location)
     if not data or "error" in data:
         return data or {"error": "Failed to fetch astronomy data"}
     
@@ -200,7 +260,7 @@ def get_current_astronomical_data(location: str) -> dict:
 
 
 @mcp.tool()
-def get_current_air_quality(location: str) -> dict:
+async def get_current_air_quality(location: str) -> dict:
     """
     Get current air quality data for a given location.
     
@@ -219,7 +279,7 @@ def get_current_air_quality(location: str) -> dict:
         - UK DEFRA Air Quality Index (1-10 scale: 1-3=Low, 4-6=Moderate, 7-9=High, 10=Very High)
         - Location details: name, region, country, and local time
     """
-    data = _fetch_current_weather(location)
+    data = await _fetch_current_weather(location)
     if not data or "error" in data:
         return data or {"error": "Failed to fetch weather data"}
     
@@ -1,9 +1,14 @@
 """Centralized logging configuration for the weather agent."""
 
+import functools
 import logging
 from src.config import settings
 
+# Resolved once from config; shared by every logger
+LOG_LEVEL = settings.numeric_log_level
 
+
+@functools.cache
 def get_logger(name: str) -> logging.Logger:
     """
     Get a configured logger instance.
@@ -26,7 +31,6 @@ def get_logger(name: str) -> logging.Logger:
         logger.addHandler(handler)
 
     # Set log level from config
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
-    logger.setLevel(log_level)
+    logger.setLevel(LOG_LEVEL)
 
     return logger